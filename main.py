@@ -1,10 +1,42 @@
 import random
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+
+# Bit flags for each card type, combined for multi-type cards like "Action-Attack"
+ACTION_BIT = 1
+TREASURE_BIT = 2
+VICTORY_BIT = 4
+ATTACK_BIT = 8
+REACTION_BIT = 16
+CURSE_BIT = 32
+
+TYPE_BITS = MappingProxyType(
+    {
+        "Action": ACTION_BIT,
+        "Treasure": TREASURE_BIT,
+        "Victory": VICTORY_BIT,
+        "Attack": ATTACK_BIT,
+        "Reaction": REACTION_BIT,
+        "Curse": CURSE_BIT,
+    }
+)
 
 
 class DominionCard:
-    def __init__(
-        self, name, card_type, cost, actions=None, buys=None, coins=None, vp=None
-    ):
+    __slots__ = (
+        "name",
+        "card_type",
+        "type_flags",
+        "cost",
+        "actions",
+        "buys",
+        "coins",
+        "vp",
+    )
+
+    def __init__(self, name, card_type, cost, actions=0, buys=0, coins=0, vp=0):
         """
         Represents a Dominion card with various attributes.
 
@@ -17,15 +49,18 @@ class DominionCard:
         - coins (int): The number of additional coins the card provides.
         - vp (int): The number of Victory Points the card is worth (for Victory cards).
 
-        Note: Some parameters default to None and are optional for certain card types.
+        Note: Some parameters default to 0 and are optional for certain card types.
         """
         self.name = name
         self.card_type = card_type
+        self.type_flags = 0
+        for type_name in card_type.split("-"):
+            self.type_flags |= TYPE_BITS[type_name]
         self.cost = cost
-        self.actions = actions or 0
-        self.buys = buys or 0
-        self.coins = coins or 0
-        self.vp = vp or 0
+        self.actions = actions
+        self.buys = buys
+        self.coins = coins
+        self.vp = vp
 
     def __str__(self):
         """
@@ -34,6 +69,110 @@ class DominionCard:
         return f"{self.name} ({self.card_type}) - Cost: {self.cost}, Actions: {self.actions}, Buys: {self.buys}, Coins: {self.coins}, VP: {self.vp}"
 
 
+# Prototype instances for every card that can appear in the supply, built once at
+# import time and shared by every game
+COPPER = DominionCard("Copper", "Treasure", 0, coins=1)
+ESTATE = DominionCard("Estate", "Victory", 2, vp=1)
+
+BASIC_CARDS = (
+    COPPER,
+    DominionCard("Silver", "Treasure", 3, coins=2),
+    DominionCard("Gold", "Treasure", 6, coins=3),
+    ESTATE,
+    DominionCard("Duchy", "Victory", 5, vp=3),
+    DominionCard("Province", "Victory", 8, vp=6),
+    DominionCard("Curse", "Curse", 0, vp=-1),
+)
+
+BASE_ACTION_CARDS = (
+    DominionCard("Cellar", "Action", 2, actions=1),
+    DominionCard("Chapel", "Action", 2),
+    DominionCard("Moat", "Action-Reaction", 2, coins=2),
+    DominionCard("Harbinger", "Action", 3, actions=1, coins=1),
+    DominionCard("Merchant", "Action", 3, actions=1, coins=1),
+    DominionCard("Vassal", "Action", 3, coins=2),
+    DominionCard("Village", "Action", 3, actions=2, coins=1),
+    DominionCard("Workshop", "Action", 3),
+    DominionCard("Bureaucrat", "Action-Attack", 4),
+    DominionCard("Gardens", "Victory", 4),
+    DominionCard("Militia", "Action-Attack", 4, coins=2),
+    DominionCard("Moneylender", "Action", 4),
+    DominionCard("Poacher", "Action", 4, actions=1, coins=1),
+    DominionCard("Remodel", "Action", 4),
+    DominionCard("Smithy", "Action", 4, coins=3),
+    DominionCard("Throne Room", "Action", 4),
+    DominionCard("Bandit", "Action-Attack", 5),
+    DominionCard("Council Room", "Action", 5, buys=1, coins=4),
+    DominionCard("Festival", "Action", 5, actions=2, buys=1, coins=2),
+    DominionCard("Laboratory", "Action", 5, actions=1, coins=2),
+    DominionCard("Library", "Action", 5),
+    DominionCard("Market", "Action", 5, actions=1, buys=1, coins=1),
+    DominionCard("Mine", "Action", 5),
+    DominionCard("Sentry", "Action", 5, actions=1, coins=1),
+    DominionCard("Witch", "Action-Attack", 5, coins=2),
+    DominionCard("Artisan", "Action", 6),
+)
+
+# Read-only registry mapping card names to their prototype instances
+CARD_PROTOTYPES = MappingProxyType(
+    {card.name: card for card in BASE_ACTION_CARDS + BASIC_CARDS}
+)
+
+# Victory Points per card name, for the Victory and Curse cards that score them
+VICTORY_POINTS = MappingProxyType(
+    {
+        card.name: card.vp
+        for card in CARD_PROTOTYPES.values()
+        if card.type_flags & (VICTORY_BIT | CURSE_BIT)
+    }
+)
+
+# Supply sizes of Estate, Duchy, Province and Curse for each supported player count
+VICTORY_COUNTS = MappingProxyType(
+    {
+        2: (8, 8, 8, 10),
+        3: (12, 12, 12, 20),
+        4: (12, 12, 12, 30),
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def get_prototype(name):
+    """
+    Returns the prototype DominionCard for a card name, or None if not found.
+
+    Parameters:
+    - name (str): The name of the card.
+
+    Returns:
+    - DominionCard or None: The card object or None if not found.
+    """
+    return CARD_PROTOTYPES.get(name)
+
+
+def score_player(player):
+    """
+    Calculates a player's final score from all the cards they own.
+
+    Parameters:
+    - player (DominionPlayer): The player to score.
+
+    Returns:
+    - int: The total number of Victory Points.
+    """
+    total_cards = len(player.deck) + player.hand.total() + len(player.discard_pile)
+    # Special case for Gardens: worth 1 VP per 10 cards in the deck
+    gardens_vp = total_cards // 10
+    score = 0
+    # Count the Victory Points in the player's deck, hand, and discard pile
+    for card in chain(player.deck, player.hand.elements(), player.discard_pile):
+        score += VICTORY_POINTS.get(card.name, 0)
+        if card.name == "Gardens":
+            score += gardens_vp
+    return score
+
+
 class DominionPlayer:
     def __init__(self, name):
         """
@@ -43,9 +182,10 @@ class DominionPlayer:
         - name (str): The name of the player.
         """
         self.name = name
-        self.deck = self.initialize_deck()
-        self.hand = []
-        self.discard_pile = []
+        self.deck = deque(self.initialize_deck())
+        # The hand maps each card to the number of copies held
+        self.hand = Counter()
+        self.discard_pile = deque()
         self.actions = 1
         self.buys = 1
         self.coins = 0
@@ -54,10 +194,7 @@ class DominionPlayer:
         """
         Initializes the player's deck with the starting cards (Copper and Estate).
         """
-        starting_deck = [
-            DominionCard("Copper", "Treasure", 0, coins=1) for _ in range(7)
-        ]
-        starting_deck += [DominionCard("Estate", "Victory", 2, vp=1) for _ in range(3)]
+        starting_deck = [COPPER] * 7 + [ESTATE] * 3
         random.shuffle(starting_deck)
         return starting_deck
 
@@ -66,18 +203,23 @@ class DominionPlayer:
         Draws a hand of 5 cards from the player's deck, shuffling the discard pile if necessary.
         """
         num_to_draw = 5
+        # The discard pile is only shuffled in once the deck runs low, so each card is
+        # shuffled once per pass through the deck and every draw is an O(1) popleft
         if len(self.deck) < num_to_draw:
             self.shuffle_discard_into_deck()
-        self.hand = self.deck[:num_to_draw]
-        self.deck = self.deck[num_to_draw:]
+        self.hand = Counter(
+            self.deck.popleft() for _ in range(min(num_to_draw, len(self.deck)))
+        )
 
     def shuffle_discard_into_deck(self):
         """
         Shuffles the discard pile into the deck.
         """
-        random.shuffle(self.discard_pile)
-        self.deck += self.discard_pile
-        self.discard_pile = []
+        # Shuffle a list copy: indexing a deque is O(n), which makes random.shuffle slow
+        cards = list(self.discard_pile)
+        random.shuffle(cards)
+        self.deck.extend(cards)
+        self.discard_pile.clear()
 
     def play_action_card(self, card):
         """
@@ -102,11 +244,12 @@ class DominionPlayer:
         Returns:
         - bool: True if the card was successfully bought, False otherwise.
         """
-        if card.cost <= self.coins and card.name in supply and supply[card.name] > 0:
+        count = supply.get(card.name, 0)
+        if card.cost <= self.coins and count > 0:
             self.coins -= card.cost
             self.buys -= 1
             self.discard_pile.append(card)
-            supply[card.name] -= 1
+            supply[card.name] = count - 1
             return True
         return False
 
@@ -114,13 +257,99 @@ class DominionPlayer:
         """
         Ends the player's turn, moving cards from the hand to the discard pile and resetting turn attributes.
         """
-        self.discard_pile += self.hand
-        self.hand = []
+        self.discard_pile.extend(self.hand.elements())
+        self.hand.clear()
         self.actions = 1
         self.buys = 1
         self.coins = 0
 
 
+class Policy:
+    """
+    Decides which cards a player plays and buys during their turn.
+
+    Subclasses return the name of the chosen card, or None to end the current phase.
+    """
+
+    def choose_action(self, player, hand, supply):
+        """
+        Chooses an Action card to play from the player's hand.
+
+        Parameters:
+        - player (DominionPlayer): The player whose turn it is.
+        - hand (Counter): The player's hand, mapping cards to the number of copies held.
+        - supply (dict): The supply of available cards.
+
+        Returns:
+        - str or None: The name of the card to play, or None to skip the action phase.
+        """
+        raise NotImplementedError
+
+    def choose_buy(self, player, supply):
+        """
+        Chooses a card to buy from the supply.
+
+        Parameters:
+        - player (DominionPlayer): The player whose turn it is.
+        - supply (dict): The supply of available cards.
+
+        Returns:
+        - str or None: The name of the card to buy, or None to skip the buy phase.
+        """
+        raise NotImplementedError
+
+
+class HumanPolicy(Policy):
+    """
+    Asks the person at the terminal for each decision.
+    """
+
+    def choose_action(self, player, hand, supply):
+        action_card = input(
+            "Enter the name of an Action card you want to play, or 'skip' to skip the action phase: "
+        )
+        return None if action_card == "skip" else action_card
+
+    def choose_buy(self, player, supply):
+        buy_card = input(
+            "Enter the name of a card you want to buy, or 'skip' to skip the buy phase: "
+        )
+        return None if buy_card == "skip" else buy_card
+
+
+class RandomPolicy(Policy):
+    """
+    Picks uniformly among the valid choices, including skipping the phase.
+    """
+
+    def choose_action(self, player, hand, supply):
+        choices = [card.name for card in hand if card.type_flags & ACTION_BIT]
+        return random.choice(choices + [None])
+
+    def choose_buy(self, player, supply):
+        choices = [
+            name
+            for name, count in supply.items()
+            if count > 0 and CARD_PROTOTYPES[name].cost <= player.coins
+        ]
+        return random.choice(choices + [None])
+
+
+class BigMoneyPolicy(Policy):
+    """
+    The Big Money baseline: never plays Action cards and buys the best treasure or Province it can afford.
+    """
+
+    def choose_action(self, player, hand, supply):
+        return None
+
+    def choose_buy(self, player, supply):
+        for name in ("Province", "Gold", "Silver"):
+            if CARD_PROTOTYPES[name].cost <= player.coins and supply.get(name, 0) > 0:
+                return name
+        return None
+
+
 class DominionGame:
     def __init__(self, players, num_kingdom_cards=10):
         """
@@ -152,83 +381,21 @@ class DominionGame:
         supply["Copper"] = 60 - (self.num_players * 7)
         supply["Silver"] = 40
         supply["Gold"] = 30
-        if self.num_players == 2:
-            supply["Estate"] = 8
-            supply["Duchy"] = 8
-            supply["Province"] = 8
-            supply["Curse"] = 10
-        elif self.num_players == 3:
-            supply["Estate"] = 12
-            supply["Duchy"] = 12
-            supply["Province"] = 12
-            supply["Curse"] = 20
-        elif self.num_players == 4:
-            supply["Estate"] = 12
-            supply["Duchy"] = 12
-            supply["Province"] = 12
-            supply["Curse"] = 30
-        else:
+        if self.num_players not in VICTORY_COUNTS:
             raise ValueError("Invalid number of players")
+        estates, duchies, provinces, curses = VICTORY_COUNTS[self.num_players]
+        supply["Estate"] = estates
+        supply["Duchy"] = duchies
+        supply["Province"] = provinces
+        supply["Curse"] = curses
 
         # Add a random selection of Action cards from the base set
-        base_action_cards = [
-            DominionCard("Cellar", "Action", 2, actions=1),
-            DominionCard("Chapel", "Action", 2),
-            DominionCard("Moat", "Action-Reaction", 2, coins=2),
-            DominionCard("Harbinger", "Action", 3, actions=1, coins=1),
-            DominionCard("Merchant", "Action", 3, actions=1, coins=1),
-            DominionCard("Vassal", "Action", 3, coins=2),
-            DominionCard("Village", "Action", 3, actions=2, coins=1),
-            DominionCard("Workshop", "Action", 3),
-            DominionCard("Bureaucrat", "Action-Attack", 4),
-            DominionCard("Gardens", "Victory", 4),
-            DominionCard("Militia", "Action-Attack", 4, coins=2),
-            DominionCard("Moneylender", "Action", 4),
-            DominionCard("Poacher", "Action", 4, actions=1, coins=1),
-            DominionCard("Remodel", "Action", 4),
-            DominionCard("Smithy", "Action", 4, coins=3),
-            DominionCard("Throne Room", "Action", 4),
-            DominionCard("Bandit", "Action-Attack", 5),
-            DominionCard("Council Room", "Action", 5, buys=1, coins=4),
-            DominionCard("Festival", "Action", 5, actions=2, buys=1, coins=2),
-            DominionCard("Laboratory", "Action", 5, actions=1, coins=2),
-            DominionCard("Library", "Action", 5),
-            DominionCard("Market", "Action", 5, actions=1, buys=1, coins=1),
-            DominionCard("Mine", "Action", 5),
-            DominionCard("Sentry", "Action", 5, actions=1, coins=1),
-            DominionCard("Witch", "Action-Attack", 5, coins=2),
-            DominionCard("Artisan", "Action", 6),
-        ]
-        random.shuffle(base_action_cards)
-        selected_action_cards = base_action_cards[:num_kingdom_cards]
+        selected_action_cards = random.sample(BASE_ACTION_CARDS, num_kingdom_cards)
         for card in selected_action_cards:
             supply[card.name] = 10
 
         return supply
 
-    def get_card_by_name(self, name):
-        """
-        Returns a DominionCard object by its name, or None if not found.
-
-        Parameters:
-        - name (str): The name of the card.
-
-        Returns:
-        - DominionCard or None: The card object or None if not found.
-        """
-        for card in self.supply.keys():
-            if card == name:
-                return DominionCard(
-                    card,
-                    self.supply[card].card_type,
-                    self.supply[card].cost,
-                    self.supply[card].actions,
-                    self.supply[card].buys,
-                    self.supply[card].coins,
-                    self.supply[card].vp,
-                )
-        return None
-
     def get_current_player(self):
         """
         Returns the current player based on the turn number.
@@ -249,29 +416,32 @@ class DominionGame:
             print(f"{card}: {count}")
         print()
 
-    def play_turn(self):
+    def play_turn(self, policy=None):
         """
         Plays a turn for the current player, allowing them to play Action cards, buy cards, and end their turn.
+
+        Parameters:
+        - policy (Policy): Chooses the cards to play and buy. Defaults to asking at the terminal.
         """
+        if policy is None:
+            policy = HumanPolicy()
         player = self.get_current_player()
         print(f"It is {player.name}'s turn.")
-        print(f"Your hand: {', '.join(card.name for card in player.hand)}")
+        print(f"Your hand: {', '.join(card.name for card in player.hand.elements())}")
         print(f"Actions: {player.actions}, Buys: {player.buys}, Coins: {player.coins}")
         print()
 
         # Action phase: the player can play one Action card per action
         while player.actions > 0:
-            action_card = input(
-                "Enter the name of an Action card you want to play, or 'skip' to skip the action phase: "
-            )
-            if action_card == "skip":
+            action_card = policy.choose_action(player, player.hand, self.supply)
+            if action_card is None:
                 break
             else:
-                card = self.get_card_by_name(action_card)
+                card = get_prototype(action_card)
                 if (
                     card is not None
-                    and card.card_type.startswith("Action")
-                    and card in player.hand
+                    and card.type_flags & ACTION_BIT
+                    and player.hand[card] > 0
                 ):
                     player.play_action_card(card)
                     print(f"You played {card.name}.")
@@ -287,13 +457,11 @@ class DominionGame:
 
         # Buy phase: the player can buy one card per buy
         while player.buys > 0:
-            buy_card = input(
-                "Enter the name of a card you want to buy, or 'skip' to skip the buy phase: "
-            )
-            if buy_card == "skip":
+            buy_card = policy.choose_buy(player, self.supply)
+            if buy_card is None:
                 break
             else:
-                card = self.get_card_by_name(buy_card)
+                card = get_prototype(buy_card)
                 if card is not None and player.buy_card(card, self.supply):
                     print(f"You bought {card.name}.")
                     print(f"Buys: {player.buys}, Coins: {player.coins}")
@@ -322,36 +490,25 @@ class DominionGame:
 
         Sets the game_over attribute to True if the game is over, and prints the winner and their score.
         """
-        empty_piles = 0
-        for card, count in self.supply.items():
-            if count == 0:
-                empty_piles += 1
-                if card == "Province":
-                    # The game is over if all Province cards are gone
-                    self.game_over = True
-                    break
-        # The game is also over if three or more piles are empty
-        if empty_piles >= 3:
+        if self.supply["Province"] == 0:
+            # The game is over if all Province cards are gone
             self.game_over = True
+        else:
+            # The game is also over if three or more piles are empty
+            empty_piles = 0
+            for count in self.supply.values():
+                if count == 0:
+                    empty_piles += 1
+                    if empty_piles >= 3:
+                        self.game_over = True
+                        break
 
         if self.game_over:
             print("The game is over.")
             # Calculate the scores for each player
             scores = {}
             for player in self.players:
-                score = 0
-                # Count the Victory Points in the player's deck, hand, and discard pile
-                for card in player.deck + player.hand + player.discard_pile:
-                    if card.card_type == "Victory" or card.card_type == "Curse":
-                        score += card.vp
-                    # Special case for Gardens: worth 1 VP per 10 cards in the deck
-                    if card.name == "Gardens":
-                        score += (
-                            len(player.deck)
-                            + len(player.hand)
-                            + len(player.discard_pile)
-                        ) // 10
-                scores[player.name] = score
+                scores[player.name] = score_player(player)
 
             # Find the winner
             max_score = max(scores.values())
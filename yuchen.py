@@ -1,4 +1,5 @@
 import random
+from collections import deque
 
 class DominionCard:
     def __init__(self, name, card_type, cost, actions=0, buys=0, coins=0, vp=0, draw=0):
@@ -17,7 +18,7 @@ class DominionCard:
 class DominionPlayer:
     def __init__(self, name):
         self.name = name
-        self.deck = self.initialize_deck()
+        self.deck = deque(self.initialize_deck())
         self.hand = []
         self.discard_pile = []
         self.actions = 1
@@ -38,11 +39,11 @@ class DominionPlayer:
         if len(self.deck) == 0 and len(self.discard_pile) > 0:
             self.shuffle_discard_into_deck()
         if len(self.deck) > 0:
-            self.hand.append(self.deck.pop(0))
+            self.hand.append(self.deck.popleft())
 
     def shuffle_discard_into_deck(self):
-        self.deck = self.discard_pile
-        random.shuffle(self.deck)
+        random.shuffle(self.discard_pile)
+        self.deck.extend(self.discard_pile)
         self.discard_pile = []
 
     def play_action_card(self, card):